@@ -7,7 +7,24 @@ See README.rst & INSTALL.rst for more information.
     Version number as calculated by https://github.com/pypa/setuptools_scm
 """
 
-from . import load_sim, sim_data_sources, simulator, utils
+import importlib as _importlib
+import typing as _typing
+
 from ._version import __version__
 
+if _typing.TYPE_CHECKING:
+    from . import load_sim, sim_data_sources, simulator, utils
+
 __all__ = ["__version__", "load_sim", "sim_data_sources", "simulator", "utils"]
+
+
+def __getattr__(name):
+    # The submodules are imported on first access so that light-weight entry points,
+    # e.g. ``python -m atip --version``, don't pay for importing AT, Pytac and cothread.
+    if name in __all__:
+        return _importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -359,8 +359,10 @@ class ATLatticeDataSource(pytac.data_source.DataSource):
            _field_funcs (dict): A dictionary which maps Pytac lattice fields to
                                  the correct data function on the centralised
                                  ATSimulator object. Some of these functions,
-                                 via partial(), are passed a cell argument so
-                                 only relevant data is returned.
+                                 via partial(), are passed a plane argument
+                                 ('x', 'px', 'y' or 'py') so only relevant data
+                                 is returned and no further dispatch is needed
+                                 when the value is requested.
     """
 
     def __init__(self, atsim):
@@ -377,30 +379,30 @@ class ATLatticeDataSource(pytac.data_source.DataSource):
         self.units = pytac.PHYS
         self._atsim = atsim
         self._field_funcs = {
-            "chromaticity_x": self._atsim.get_chromaticity,
-            "chromaticity_y": self._atsim.get_chromaticity,
+            "chromaticity_x": partial(self._atsim.get_chromaticity, "x"),
+            "chromaticity_y": partial(self._atsim.get_chromaticity, "y"),
             "chromaticity": self._atsim.get_chromaticity,
-            "eta_prime_x": self._atsim.get_dispersion,
-            "eta_prime_y": self._atsim.get_dispersion,
+            "eta_prime_x": partial(self._atsim.get_dispersion, "px"),
+            "eta_prime_y": partial(self._atsim.get_dispersion, "py"),
             "dispersion": self._atsim.get_dispersion,
-            "emittance_x": self._atsim.get_emittance,
-            "emittance_y": self._atsim.get_emittance,
+            "emittance_x": partial(self._atsim.get_emittance, "x"),
+            "emittance_y": partial(self._atsim.get_emittance, "y"),
             "emittance": self._atsim.get_emittance,
             "closed_orbit": self._atsim.get_orbit,
-            "eta_x": self._atsim.get_dispersion,
-            "eta_y": self._atsim.get_dispersion,
+            "eta_x": partial(self._atsim.get_dispersion, "x"),
+            "eta_y": partial(self._atsim.get_dispersion, "y"),
             "energy": self._atsim.get_energy,
-            "phase_x": self._atsim.get_orbit,
-            "phase_y": self._atsim.get_orbit,
+            "phase_x": partial(self._atsim.get_orbit, "px"),
+            "phase_y": partial(self._atsim.get_orbit, "py"),
             "s_position": self._atsim.get_s,
-            "tune_x": self._atsim.get_tune,
-            "tune_y": self._atsim.get_tune,
+            "tune_x": partial(self._atsim.get_tune, "x"),
+            "tune_y": partial(self._atsim.get_tune, "y"),
             "alpha": self._atsim.get_alpha,
             "beta": self._atsim.get_beta,
             "tune": self._atsim.get_tune,
             "m66": self._atsim.get_m66,
-            "x": self._atsim.get_orbit,
-            "y": self._atsim.get_orbit,
+            "x": partial(self._atsim.get_orbit, "x"),
+            "y": partial(self._atsim.get_orbit, "y"),
             "mu": self._atsim.get_mu,
         }
 
@@ -444,22 +446,15 @@ class ATLatticeDataSource(pytac.data_source.DataSource):
                 raise ControlSystemException(error_msg)
             else:
                 logging.warning("Potentially out of date data returned. " + error_msg)
-        if field in list(self._field_funcs.keys()):
-            # The orbit x_phase and y_phase, and the eta prime_x and prime_y
-            # fields are represented by 'px' or 'py' in the ATSimulator data
-            # handling functions.
-            if (field.startswith("phase")) or (field.find("prime") != -1):
-                return self._field_funcs[field]("p" + field[-1])
-            elif field.endswith("x"):
-                return self._field_funcs[field]("x")
-            elif field.endswith("y"):
-                return self._field_funcs[field]("y")
-            else:
-                return self._field_funcs[field]()
-        else:
+        # A single lookup, rather than a membership test and then a lookup; a
+        # TypeError means an unhashable, and so invalid, field was passed.
+        try:
+            field_func = self._field_funcs[field]
+        except (KeyError, TypeError):
             raise FieldException(
                 f"Lattice data source {self} does not have field {field}"
-            )
+            ) from None
+        return field_func()
 
     def set_value(self, field, value, throw=None):
         """Set the value for a field.
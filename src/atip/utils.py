@@ -5,6 +5,9 @@ import pytac
 
 import atip
 
+# Directory containing the bundled AT lattice .mat files, resolved once on import.
+_RINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rings")
+
 
 def load_at_lattice(mode="I04", **kwargs):
     """Load an AT lattice from a .mat file in the 'rings' directory.
@@ -19,9 +22,7 @@ def load_at_lattice(mode="I04", **kwargs):
     Returns:
         at.lattice.Lattice: An AT lattice object.
     """
-    filepath = os.path.join(
-        os.path.dirname(__file__), "".join(["rings/", mode, ".mat"])
-    )
+    filepath = os.path.join(_RINGS_DIR, mode + ".mat")
     at_lattice = at.load.load_mat(filepath, name=mode, **kwargs)
     for index, elem in enumerate(at_lattice):
         elem.Index = index + 1
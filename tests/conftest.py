@@ -62,11 +62,18 @@ def atlds():
     return atip.sim_data_sources.ATLatticeDataSource(mock.Mock())
 
 
-@pytest.fixture()
-def at_lattice():
+@pytest.fixture(scope="session")
+def hmba_lattice():
     return atip.utils.load_at_lattice("HMBA")
 
 
+@pytest.fixture()
+def at_lattice(hmba_lattice):
+    # ATSimulator modifies the lattice it is given, so each test gets its own copy
+    # of the lattice rather than reloading it from the .mat file every time.
+    return hmba_lattice.deepcopy()
+
+
 @pytest.fixture(scope="session")
 def pytac_lattice():
     return load_csv.load("DIAD", cs.ControlSystem())
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+
+def test_submodules_are_imported_lazily():
+    code = "\n".join(
+        [
+            "import sys",
+            "import atip",
+            "assert 'atip.simulator' not in sys.modules",
+            "assert 'simulator' in dir(atip)",
+            "from atip import load_sim",
+            "assert callable(load_sim.load)",
+            "assert callable(atip.utils.load_at_lattice)",
+        ]
+    )
+    subprocess.check_call([sys.executable, "-c", code])
@@ -6,39 +6,56 @@ from testfixtures import LogCapture
 
 import atip
 
+# (ATSimulator method, lattice field, plane argument bound via partial or None)
+FIELD_FUNCS = [
+    ("get_chromaticity", "chromaticity_x", "x"),
+    ("get_chromaticity", "chromaticity_y", "y"),
+    ("get_chromaticity", "chromaticity", None),
+    ("get_dispersion", "eta_prime_x", "px"),
+    ("get_dispersion", "eta_prime_y", "py"),
+    ("get_dispersion", "dispersion", None),
+    ("get_emittance", "emittance_x", "x"),
+    ("get_emittance", "emittance_y", "y"),
+    ("get_emittance", "emittance", None),
+    ("get_orbit", "closed_orbit", None),
+    ("get_dispersion", "eta_x", "x"),
+    ("get_dispersion", "eta_y", "y"),
+    ("get_energy", "energy", None),
+    ("get_orbit", "phase_x", "px"),
+    ("get_orbit", "phase_y", "py"),
+    ("get_s", "s_position", None),
+    ("get_tune", "tune_x", "x"),
+    ("get_tune", "tune_y", "y"),
+    ("get_alpha", "alpha", None),
+    ("get_beta", "beta", None),
+    ("get_tune", "tune", None),
+    ("get_m66", "m66", None),
+    ("get_orbit", "x", "x"),
+    ("get_orbit", "y", "y"),
+    ("get_mu", "mu", None),
+]
+
+
+def check_field_func(atlds, method, field, plane):
+    func = atlds._field_funcs[field]
+    if plane is not None:  # i.e. the plane is bound via functools partial.
+        assert func.func == getattr(atlds._atsim, method), field
+        assert func.args == (plane,), field
+    else:
+        assert func == getattr(atlds._atsim, method), field
+
+
+def test_lat_field_funcs(atlds):
+    for method, field, plane in FIELD_FUNCS:
+        check_field_func(atlds, method, field, plane)
+
 
 @pytest.mark.parametrize(
-    "func_str,field",
-    [
-        ("atlds._atsim.get_chromaticity", "chromaticity_x"),
-        ("atlds._atsim.get_chromaticity", "chromaticity_y"),
-        ("atlds._atsim.get_chromaticity", "chromaticity"),
-        ("atlds._atsim.get_dispersion", "eta_prime_x"),
-        ("atlds._atsim.get_dispersion", "eta_prime_y"),
-        ("atlds._atsim.get_dispersion", "dispersion"),
-        ("atlds._atsim.get_emittance", "emittance_x"),
-        ("atlds._atsim.get_emittance", "emittance_y"),
-        ("atlds._atsim.get_emittance", "emittance"),
-        ("atlds._atsim.get_orbit", "closed_orbit"),
-        ("atlds._atsim.get_dispersion", "eta_x"),
-        ("atlds._atsim.get_dispersion", "eta_y"),
-        ("atlds._atsim.get_energy", "energy"),
-        ("atlds._atsim.get_orbit", "phase_x"),
-        ("atlds._atsim.get_orbit", "phase_y"),
-        ("atlds._atsim.get_s", "s_position"),
-        ("atlds._atsim.get_tune", "tune_x"),
-        ("atlds._atsim.get_tune", "tune_y"),
-        ("atlds._atsim.get_alpha", "alpha"),
-        ("atlds._atsim.get_beta", "beta"),
-        ("atlds._atsim.get_tune", "tune"),
-        ("atlds._atsim.get_m66", "m66"),
-        ("atlds._atsim.get_orbit", "x"),
-        ("atlds._atsim.get_orbit", "y"),
-        ("atlds._atsim.get_mu", "mu"),
-    ],
+    "method,field,plane",
+    [row for row in FIELD_FUNCS if row[1] in {"phase_x", "tune_y", "energy"}],
 )
-def test_lat_field_funcs(func_str, field, atlds):
-    assert atlds._field_funcs[field] == eval(func_str)
+def test_lat_field_funcs_smoke(atlds, method, field, plane):
+    check_field_func(atlds, method, field, plane)
 
 
 def test_lat_get_fields(atlds):
@@ -122,6 +139,10 @@ def test_lat_get_value():
     atsim.get_orbit.assert_called_with("y")
     atlds.get_value("phase_y")
     atsim.get_orbit.assert_called_with("py")
+    atlds.get_value("energy")
+    atsim.get_energy.assert_called_with()
+    atlds.get_value("chromaticity")
+    atsim.get_chromaticity.assert_called_with()
 
 
 @pytest.mark.parametrize(